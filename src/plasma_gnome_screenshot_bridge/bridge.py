@@ -15,13 +15,13 @@ Adapted for KDE Plasma with multi-backend support.
 
 import argparse
 import asyncio
-from datetime import datetime, timezone
+import functools
 import logging
 import shutil
 import signal
-import subprocess
 import sys
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional, Set, Tuple
 
 from dbus_next.aio import MessageBus
 from dbus_next.service import ServiceInterface, method
@@ -31,122 +31,154 @@ from . import __version__
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """Resolve an executable on PATH once and remember the result."""
+    return shutil.which(name)
+
+
+_SWAYIDLE = _which("swayidle")
+
+
 class ScreenshotBackend:
     """Abstract base for screenshot backends."""
     name: str = "base"
 
+    @classmethod
+    def _lookup(cls) -> Optional[str]:
+        return _which(cls.name)
+
+    @classmethod
+    def binary(cls) -> str:
+        """Absolute path of the backend executable."""
+        path = cls._lookup()
+        if path is None:
+            raise RuntimeError(f"{cls.name} is not installed")
+        return path
+
     @classmethod
     def is_available(cls) -> bool:
-        raise NotImplementedError
+        return cls._lookup() is not None
 
     @classmethod
-    def capture_full(cls, filename: str, include_cursor: bool = False) -> bool:
+    async def capture_full(cls, filename: str, include_cursor: bool = False,
+                           fast_png: bool = False) -> bool:
         raise NotImplementedError
 
     @classmethod
-    def capture_area(cls, filename: str, x: int, y: int, width: int, height: int) -> bool:
+    async def capture_area(cls, filename: str, x: int, y: int, width: int, height: int,
+                           fast_png: bool = False) -> bool:
         raise NotImplementedError
 
     @classmethod
-    def capture_window(cls, filename: str, include_cursor: bool = False,
-                       include_decorations: bool = True) -> bool:
+    async def capture_window(cls, filename: str, include_cursor: bool = False,
+                             include_decorations: bool = True, fast_png: bool = False) -> bool:
         raise NotImplementedError
 
+    @staticmethod
+    async def _run(argv: Tuple[str, ...]) -> bool:
+        """Run a capture command without blocking the event loop."""
+        # Every descriptor we own (including the DBus socket) is created
+        # non-inheritable, so skipping the close_fds sweep is safe and lets
+        # CPython take the cheaper posix_spawn/vfork path.
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            close_fds=False,
+        )
+        return await proc.wait() == 0
+
 
 class SpectacleBackend(ScreenshotBackend):
     """KDE Spectacle screenshot backend."""
     name = "spectacle"
+    _CMD_FULL = ("-b", "-n", "-f", "-o")
+    _CMD_WINDOW = ("-b", "-n", "-a", "-o")
 
     @classmethod
-    def is_available(cls) -> bool:
-        return shutil.which("spectacle") is not None
-
-    @classmethod
-    def capture_full(cls, filename: str, include_cursor: bool = False) -> bool:
-        cmd = ["spectacle", "-b", "-n", "-f", "-o", filename]
+    async def capture_full(cls, filename: str, include_cursor: bool = False,
+                           fast_png: bool = False) -> bool:
+        argv: Tuple[str, ...] = (cls.binary(),) + cls._CMD_FULL + (filename,)
         if include_cursor:
-            cmd.append("-p")
-        result = subprocess.run(cmd, capture_output=True)
-        return result.returncode == 0
+            argv += ("-p",)
+        return await cls._run(argv)
 
     @classmethod
-    def capture_area(cls, filename: str, x: int, y: int, width: int, height: int) -> bool:
+    async def capture_area(cls, filename: str, x: int, y: int, width: int, height: int,
+                           fast_png: bool = False) -> bool:
         logger.warning("Spectacle doesn't support coordinate-based area capture, "
                       "capturing full screen instead")
-        return cls.capture_full(filename)
+        return await cls.capture_full(filename)
 
     @classmethod
-    def capture_window(cls, filename: str, include_cursor: bool = False,
-                       include_decorations: bool = True) -> bool:
-        cmd = ["spectacle", "-b", "-n", "-a", "-o", filename]
+    async def capture_window(cls, filename: str, include_cursor: bool = False,
+                             include_decorations: bool = True, fast_png: bool = False) -> bool:
+        argv: Tuple[str, ...] = (cls.binary(),) + cls._CMD_WINDOW + (filename,)
         if include_cursor:
-            cmd.append("-p")
+            argv += ("-p",)
         if not include_decorations:
-            cmd.append("-e")
-        result = subprocess.run(cmd, capture_output=True)
-        return result.returncode == 0
+            argv += ("-e",)
+        return await cls._run(argv)
 
 
 class GrimBackend(ScreenshotBackend):
     """Grim screenshot backend for wlroots-based compositors."""
     name = "grim"
+    _FAST_PNG = ("-t", "png", "-l", "0")
 
     @classmethod
-    def is_available(cls) -> bool:
-        return shutil.which("grim") is not None
-
-    @classmethod
-    def capture_full(cls, filename: str, include_cursor: bool = False) -> bool:
-        cmd = ["grim"]
+    async def capture_full(cls, filename: str, include_cursor: bool = False,
+                           fast_png: bool = False) -> bool:
+        argv: Tuple[str, ...] = (cls.binary(),) + (cls._FAST_PNG if fast_png else ())
         if include_cursor:
-            cmd.append("-c")
-        cmd.append(filename)
-        result = subprocess.run(cmd, capture_output=True)
-        return result.returncode == 0
+            argv += ("-c",)
+        return await cls._run(argv + (filename,))
 
     @classmethod
-    def capture_area(cls, filename: str, x: int, y: int, width: int, height: int) -> bool:
-        cmd = ["grim", "-g", f"{x},{y} {width}x{height}", filename]
-        result = subprocess.run(cmd, capture_output=True)
-        return result.returncode == 0
+    async def capture_area(cls, filename: str, x: int, y: int, width: int, height: int,
+                           fast_png: bool = False) -> bool:
+        if width <= 0 or height <= 0:
+            logger.warning("Invalid capture area %dx%d", width, height)
+            return False
+        argv: Tuple[str, ...] = (cls.binary(),) + (cls._FAST_PNG if fast_png else ())
+        return await cls._run(argv + ("-g", f"{x},{y} {width}x{height}", filename))
 
     @classmethod
-    def capture_window(cls, filename: str, include_cursor: bool = False,
-                       include_decorations: bool = True) -> bool:
+    async def capture_window(cls, filename: str, include_cursor: bool = False,
+                             include_decorations: bool = True, fast_png: bool = False) -> bool:
         logger.warning("Grim doesn't support window capture, capturing full screen")
-        return cls.capture_full(filename, include_cursor)
+        return await cls.capture_full(filename, include_cursor, fast_png)
 
 
 class GnomeScreenshotBackend(ScreenshotBackend):
     """GNOME Screenshot backend (fallback)."""
     name = "gnome-screenshot"
+    _CMD_FULL = ("-f",)
+    _CMD_WINDOW = ("-w", "-f")
 
     @classmethod
-    def is_available(cls) -> bool:
-        return shutil.which("gnome-screenshot") is not None
-
-    @classmethod
-    def capture_full(cls, filename: str, include_cursor: bool = False) -> bool:
-        cmd = ["gnome-screenshot", "-f", filename]
+    async def capture_full(cls, filename: str, include_cursor: bool = False,
+                           fast_png: bool = False) -> bool:
+        argv: Tuple[str, ...] = (cls.binary(),) + cls._CMD_FULL + (filename,)
         if include_cursor:
-            cmd.append("-p")
-        result = subprocess.run(cmd, capture_output=True)
-        return result.returncode == 0
+            argv += ("-p",)
+        return await cls._run(argv)
 
     @classmethod
-    def capture_area(cls, filename: str, x: int, y: int, width: int, height: int) -> bool:
-        return cls.capture_full(filename)
+    async def capture_area(cls, filename: str, x: int, y: int, width: int, height: int,
+                           fast_png: bool = False) -> bool:
+        return await cls.capture_full(filename)
 
     @classmethod
-    def capture_window(cls, filename: str, include_cursor: bool = False,
-                       include_decorations: bool = True) -> bool:
-        cmd = ["gnome-screenshot", "-w", "-f", filename]
+    async def capture_window(cls, filename: str, include_cursor: bool = False,
+                             include_decorations: bool = True, fast_png: bool = False) -> bool:
+        argv: Tuple[str, ...] = (cls.binary(),) + cls._CMD_WINDOW + (filename,)
         if include_cursor:
-            cmd.append("-p")
+            argv += ("-p",)
         if not include_decorations:
-            cmd.append("-B")
-        result = subprocess.run(cmd, capture_output=True)
-        return result.returncode == 0
+            argv += ("-B",)
+        return await cls._run(argv)
 
 
 BACKENDS: List[type] = [
@@ -162,15 +194,15 @@ def detect_backend(preferred: Optional[str] = None) -> Optional[ScreenshotBacken
         for backend_cls in BACKENDS:
             if backend_cls.name == preferred:
                 if backend_cls.is_available():
-                    logger.info(f"Using preferred backend: {backend_cls.name}")
+                    logger.info("Using preferred backend: %s", backend_cls.name)
                     return backend_cls
                 else:
-                    logger.warning(f"Preferred backend '{preferred}' not available")
+                    logger.warning("Preferred backend '%s' not available", preferred)
                 break
 
     for backend_cls in BACKENDS:
         if backend_cls.is_available():
-            logger.info(f"Auto-detected backend: {backend_cls.name}")
+            logger.info("Auto-detected backend: %s", backend_cls.name)
             return backend_cls
 
     return None
@@ -179,57 +211,111 @@ def detect_backend(preferred: Optional[str] = None) -> Optional[ScreenshotBacken
 class ScreenshotInterface(ServiceInterface):
     """DBus interface implementing org.gnome.Shell.Screenshot"""
 
-    def __init__(self, backend: ScreenshotBackend, warn_before: bool = False):
+    def __init__(self, backend: ScreenshotBackend, warn_before: bool = False,
+                 bus: Optional[MessageBus] = None, fast_png: bool = False):
         super().__init__("org.gnome.Shell.Screenshot")
         self.backend = backend
         self.warn_before = warn_before
+        self.fast_png = fast_png
+        self.bus = bus
+        self._inflight: Dict[Tuple[str, bool], asyncio.Future] = {}
+        self._notifications: Optional[asyncio.Future] = None
+        self._warn_tasks: Set[asyncio.Task] = set()
+
+    async def _introspect_notifications(self):
+        introspection = await self.bus.introspect(
+            "org.freedesktop.Notifications", "/org/freedesktop/Notifications")
+        proxy = self.bus.get_proxy_object(
+            "org.freedesktop.Notifications", "/org/freedesktop/Notifications", introspection)
+        return proxy.get_interface("org.freedesktop.Notifications")
+
+    def prepare_notifications(self) -> asyncio.Future:
+        """Build the notifications proxy once on the shared bus connection.
+
+        Concurrent callers share the same pending lookup; a failed lookup is
+        forgotten so the next warning retries it.
+        """
+        if self._notifications is None:
+            self._notifications = asyncio.ensure_future(self._introspect_notifications())
+            self._notifications.add_done_callback(self._notifications_done)
+        return self._notifications
+
+    def _notifications_done(self, fut: asyncio.Future):
+        if fut.cancelled() or fut.exception() is not None:
+            self._notifications = None
+
+    async def _warn(self):
+        """Send the warning notification over the existing bus connection."""
+        try:
+            notifications = await self.prepare_notifications()
+            await notifications.call_notify(
+                "Screenshot", 0, "", "Screenshot", "A screenshot will be taken...",
+                [], {}, 2000)
+        except Exception as e:
+            logger.debug("Failed to send notification: %s", e)
 
     def _maybe_warn(self):
-        if self.warn_before:
-            try:
-                subprocess.run([
-                    "notify-send", "-u", "normal", "-t", "2000",
-                    "Screenshot", "A screenshot will be taken..."
-                ], capture_output=True)
-            except Exception:
-                pass
+        if self.warn_before and self.bus:
+            # Fire and forget: the notification must never delay the capture
+            task = asyncio.create_task(self._warn())
+            self._warn_tasks.add(task)
+            task.add_done_callback(self._warn_tasks.discard)
 
     @method()
-    def Screenshot(self, include_cursor: 'b', flash: 'b', filename: 's') -> 'bs':
-        logger.info(f"Screenshot requested: cursor={include_cursor}, file={filename}")
-        self._maybe_warn()
+    async def Screenshot(self, include_cursor: 'b', flash: 'b', filename: 's') -> 'bs':
+        logger.info("Screenshot requested: cursor=%s, file=%s", include_cursor, filename)
+        # Coalesce identical requests for the same file into one capture
+        key = (filename, bool(include_cursor))
+        fut = self._inflight.get(key)
+        if fut is not None:
+            logger.debug("Joining in-flight screenshot: %s", filename)
+            return await asyncio.shield(fut)
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
         try:
-            success = self.backend.capture_full(filename, include_cursor)
-            logger.info(f"Screenshot {'saved' if success else 'failed'}: {filename}")
+            self._maybe_warn()
+            try:
+                success = await self.backend.capture_full(filename, include_cursor, self.fast_png)
+                logger.info("Screenshot %s: %s", "saved" if success else "failed", filename)
+            except Exception as e:
+                logger.exception("Screenshot error: %s", e)
+                success = False
+            fut.set_result([success, filename])
             return [success, filename]
-        except Exception as e:
-            logger.exception(f"Screenshot error: {e}")
-            return [False, filename]
+        finally:
+            if not fut.done():
+                fut.set_result([False, filename])
+            del self._inflight[key]
 
     @method()
-    def ScreenshotWindow(self, include_frame: 'b', include_cursor: 'b',
-                         flash: 'b', filename: 's') -> 'bs':
-        logger.info(f"Window screenshot requested: file={filename}")
+    async def ScreenshotWindow(self, include_frame: 'b', include_cursor: 'b',
+                               flash: 'b', filename: 's') -> 'bs':
+        logger.info("Window screenshot requested: file=%s", filename)
         self._maybe_warn()
         try:
-            success = self.backend.capture_window(filename, include_cursor, include_frame)
-            logger.info(f"Window screenshot {'saved' if success else 'failed'}: {filename}")
+            success = await self.backend.capture_window(
+                filename, include_cursor, include_frame, self.fast_png)
+            logger.info("Window screenshot %s: %s", "saved" if success else "failed", filename)
             return [success, filename]
         except Exception as e:
-            logger.exception(f"Window screenshot error: {e}")
+            logger.exception("Window screenshot error: %s", e)
             return [False, filename]
 
     @method()
-    def ScreenshotArea(self, x: 'i', y: 'i', width: 'i', height: 'i',
-                       flash: 'b', filename: 's') -> 'bs':
-        logger.info(f"Area screenshot requested: ({x},{y}) {width}x{height}")
+    async def ScreenshotArea(self, x: 'i', y: 'i', width: 'i', height: 'i',
+                             flash: 'b', filename: 's') -> 'bs':
+        logger.info("Area screenshot requested: (%d,%d) %dx%d", x, y, width, height)
+        if width <= 0 or height <= 0:
+            logger.warning("Rejecting empty screenshot area: %dx%d", width, height)
+            return [False, filename]
         self._maybe_warn()
         try:
-            success = self.backend.capture_area(filename, x, y, width, height)
-            logger.info(f"Area screenshot {'saved' if success else 'failed'}: {filename}")
+            success = await self.backend.capture_area(
+                filename, x, y, width, height, self.fast_png)
+            logger.info("Area screenshot %s: %s", "saved" if success else "failed", filename)
             return [success, filename]
         except Exception as e:
-            logger.exception(f"Area screenshot error: {e}")
+            logger.exception("Area screenshot error: %s", e)
             return [False, filename]
 
 
@@ -238,18 +324,21 @@ class IdleMonitorInterface(ServiceInterface):
 
     def __init__(self):
         super().__init__("org.gnome.Mutter.IdleMonitor")
-        self.last_active = datetime.now(timezone.utc)
+        self.last_active_ns = time.monotonic_ns()
         self._monitor_process: Optional[asyncio.subprocess.Process] = None
         self._monitor_task: Optional[asyncio.Task] = None
 
     async def start_monitoring(self):
         """Start idle monitoring."""
         # Try swayidle first
-        if shutil.which("swayidle"):
+        if _SWAYIDLE:
             try:
+                # swayidle only reports "resume" after a timeout has fired, so
+                # keep a short timeout to arm it but run a silent no-op for it:
+                # the loop below is then woken only by resume events.
                 self._monitor_process = await asyncio.create_subprocess_exec(
-                    "swayidle", "-w",
-                    "timeout", "1", "echo timeout",
+                    _SWAYIDLE, "-w",
+                    "timeout", "1", ":",
                     "resume", "echo resume",
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.DEVNULL,
@@ -258,7 +347,7 @@ class IdleMonitorInterface(ServiceInterface):
                 logger.info("Started swayidle idle monitor")
                 return True
             except Exception as e:
-                logger.debug(f"Failed to start swayidle: {e}")
+                logger.debug("Failed to start swayidle: %s", e)
 
         logger.warning("No idle monitor available, idle time will not be tracked")
         return False
@@ -268,10 +357,10 @@ class IdleMonitorInterface(ServiceInterface):
             return
         try:
             async for line in self._monitor_process.stdout:
-                if line.decode().strip() == "resume":
-                    self.last_active = datetime.now(timezone.utc)
+                if line.rstrip(b"\r\n") == b"resume":
+                    self.last_active_ns = time.monotonic_ns()
         except Exception as e:
-            logger.debug(f"Idle monitor loop error: {e}")
+            logger.debug("Idle monitor loop error: %s", e)
 
     async def stop_monitoring(self):
         if self._monitor_task:
@@ -286,9 +375,8 @@ class IdleMonitorInterface(ServiceInterface):
 
     @method()
     def GetIdletime(self) -> 't':
-        delta = datetime.now(timezone.utc) - self.last_active
-        idle_ms = round(delta.total_seconds() * 1000)
-        logger.debug(f"Idle time: {idle_ms}ms")
+        idle_ms = (time.monotonic_ns() - self.last_active_ns) // 1_000_000
+        logger.debug("Idle time: %dms", idle_ms)
         return idle_ms
 
 
@@ -296,13 +384,15 @@ class ScreenshotBridge:
     """Main bridge application."""
 
     def __init__(self, backend: Optional[str] = None,
-                 warn_before: bool = False, enable_idle: bool = True):
+                 warn_before: bool = False, enable_idle: bool = True,
+                 fast_png: bool = False):
         self.backend_name = backend
         self.warn_before = warn_before
+        self.fast_png = fast_png
         self.enable_idle = enable_idle
         self.bus: Optional[MessageBus] = None
         self.idle_monitor: Optional[IdleMonitorInterface] = None
-        self._running = False
+        self._stop_event: Optional[asyncio.Event] = None
 
     async def start(self):
         backend = detect_backend(self.backend_name)
@@ -315,38 +405,54 @@ class ScreenshotBridge:
         await self.bus.connect()
         logger.info("Connected to DBus session bus")
 
-        screenshot_iface = ScreenshotInterface(backend, self.warn_before)
+        screenshot_iface = ScreenshotInterface(
+            backend, self.warn_before, self.bus, self.fast_png)
         self.bus.export("/org/gnome/Shell/Screenshot", screenshot_iface)
-        await self.bus.request_name("org.gnome.Shell.Screenshot")
-        logger.info("Registered org.gnome.Shell.Screenshot")
+        pending = [self.bus.request_name("org.gnome.Shell.Screenshot")]
+        if self.warn_before:
+            # Resolve the notifications proxy up front so the first warning is immediate
+            screenshot_iface.prepare_notifications()
 
         if self.enable_idle:
             self.idle_monitor = IdleMonitorInterface()
-            await self.idle_monitor.start_monitoring()
             self.bus.export("/org/gnome/Mutter/IdleMonitor/Core", self.idle_monitor)
-            await self.bus.request_name("org.gnome.Mutter.IdleMonitor")
+            pending.append(self.bus.request_name("org.gnome.Mutter.IdleMonitor"))
+            pending.append(self.idle_monitor.start_monitoring())
+
+        # Name requests and the idle monitor spawn are independent round-trips
+        await asyncio.gather(*pending)
+        logger.info("Registered org.gnome.Shell.Screenshot")
+        if self.enable_idle:
             logger.info("Registered org.gnome.Mutter.IdleMonitor")
 
-        self._running = True
-        logger.info(f"Bridge started with backend: {backend.name}")
+        logger.info("Bridge started with backend: %s", backend.name)
         return True
 
     async def run_forever(self):
-        if not self._running:
+        # Created here rather than in __init__: on Python 3.9 an Event binds to
+        # the loop current at construction time, which may not be the running one.
+        self._stop_event = asyncio.Event()
+        if self.bus is None:
             if not await self.start():
                 return
         try:
-            while self._running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
         except asyncio.CancelledError:
             pass
 
+    def request_stop(self):
+        """Ask run_forever() to return; safe to call from a signal handler."""
+        if self._stop_event:
+            self._stop_event.set()
+
     async def stop(self):
-        self._running = False
         if self.idle_monitor:
             await self.idle_monitor.stop_monitoring()
+            self.idle_monitor = None
         if self.bus:
             self.bus.disconnect()
+            self.bus = None
+        self.request_stop()
         logger.info("Bridge stopped")
 
 
@@ -359,12 +465,7 @@ def setup_logging(verbose: bool = False, debug: bool = False):
     )
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        prog="plasma-gnome-screenshot-bridge",
-        description="DBus bridge implementing GNOME Screenshot interface for Wayland compositors",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   %(prog)s                    Auto-detect backend and run
   %(prog)s -b spectacle       Force KDE Spectacle backend
@@ -376,17 +477,32 @@ Backends:
   spectacle         KDE Plasma
   grim              wlroots (Sway, Hyprland, etc.)
   gnome-screenshot  GNOME (fallback)
-        """,
+        """
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="plasma-gnome-screenshot-bridge",
+        description="DBus bridge implementing GNOME Screenshot interface for Wayland compositors",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
     parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {__version__}")
     parser.add_argument("-b", "--backend", choices=["spectacle", "grim", "gnome-screenshot"],
                         help="Screenshot backend (default: auto-detect)")
     parser.add_argument("-w", "--warn", action="store_true",
                         help="Show notification before screenshots")
+    parser.add_argument("--fast-png", action="store_true",
+                        help="Write uncompressed PNGs (grim only; faster, larger files)")
     parser.add_argument("--no-idle", action="store_true", help="Disable idle monitoring")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     parser.add_argument("-D", "--debug", action="store_true", help="Debug output")
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    return _get_parser().parse_args(argv)
 
 
 async def async_main(args: argparse.Namespace):
@@ -394,11 +510,15 @@ async def async_main(args: argparse.Namespace):
         backend=args.backend,
         warn_before=args.warn,
         enable_idle=not args.no_idle,
+        fast_png=args.fast_png,
     )
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(sig, lambda: asyncio.create_task(bridge.stop()))
-    await bridge.run_forever()
+        loop.add_signal_handler(sig, bridge.request_stop)
+    try:
+        await bridge.run_forever()
+    finally:
+        await bridge.stop()
 
 
 def main():
@@ -409,7 +529,7 @@ def main():
     except KeyboardInterrupt:
         pass
     except Exception as e:
-        logger.exception(f"Fatal error: {e}")
+        logger.exception("Fatal error: %s", e)
         sys.exit(1)
 
 